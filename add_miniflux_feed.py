@@ -13,128 +13,668 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
+import json
 import os
+import socket
 import sys
-import requests
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def get_categories(server_url: str, api_key: str) -> list:
+if TYPE_CHECKING:
+    import requests
+
+
+# Location and lifetime of the on-disk categories cache
+CACHE_DIR_NAME = "miniflux_utils"
+CATEGORIES_CACHE_TTL = 3600
+
+# Maximum number of feeds added concurrently (and pooled connections)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Backoff between retries and the responses that are worth retrying
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# Socket options for API connections. urllib3 already sets TCP_NODELAY by
+# default; SO_KEEPALIVE lets the kernel probe long-idle pooled connections
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+def _requests():
     """
-    Get all categories from Miniflux server.
+    Import requests on first use.
+    
+    Importing requests takes longer than most of what the script does, so
+    it is deferred until an API call is made. Paths such as --help and
+    argument validation never pay for it.
+    """
+    import requests
+    return requests
+
+
+def _json_loads(data: bytes):
+    """Parse JSON with orjson when it is installed, falling back to json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize JSON with orjson when it is installed, falling back to json."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def validate_url(url: str, name: str = "URL") -> None:
+    """
+    Check that a URL is an absolute http(s) URL.
+    
+    This catches obviously malformed URLs locally instead of spending a
+    round-trip on a request the server would reject.
     
     Args:
-        server_url: The Miniflux server URL
-        api_key: The Miniflux API key
+        url: The URL to check
+        name: What the URL is, used in the error message
+        
+    Raises:
+        ValueError: If the URL is not an absolute http(s) URL
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        raise ValueError(f"Invalid {name}: {url!r}")
+
+
+def _create_adapter(**kwargs) -> "requests.adapters.HTTPAdapter":
+    """
+    Create a transport adapter that applies SOCKET_OPTIONS to its sockets.
+    
+    Args:
+        **kwargs: Passed on to requests.adapters.HTTPAdapter
         
     Returns:
-        list: List of category dictionaries with 'id' and 'title' fields
+        requests.adapters.HTTPAdapter: The configured adapter
+    """
+    from requests.adapters import HTTPAdapter
+    
+    class SocketOptionsAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **pool_kwargs):
+            pool_kwargs.setdefault("socket_options", SOCKET_OPTIONS)
+            super().init_poolmanager(*args, **pool_kwargs)
         
-    Raises:
-        requests.exceptions.RequestException: If the API request fails
+        def proxy_manager_for(self, proxy, **proxy_kwargs):
+            proxy_kwargs.setdefault("socket_options", SOCKET_OPTIONS)
+            return super().proxy_manager_for(proxy, **proxy_kwargs)
+    
+    return SocketOptionsAdapter(**kwargs)
+
+
+def create_session(api_key: str, retries: int = 0) -> "requests.Session":
     """
-    # Ensure server URL doesn't end with a slash
-    server_url = server_url.rstrip('/')
+    Create an HTTP session for talking to the Miniflux API.
     
-    # Prepare the API endpoint
-    api_endpoint = f"{server_url}/v1/categories"
+    The session carries the authentication headers and keeps connections
+    alive, so consecutive API calls reuse the same TCP/TLS connection.
     
-    # Prepare headers
-    headers = {
+    With retries enabled, failed connection attempts are retried with
+    exponential backoff for every request. Read errors and 502/503/504
+    responses are retried only for GET requests: a POST may already have
+    created the feed, and repeating it would report a spurious failure.
+    Other errors, including all 4xx responses, are reported right away as
+    before.
+    
+    Args:
+        api_key: The Miniflux API key
+        retries: How many times to retry a failed request
+        
+    Returns:
+        requests.Session: A session with the Miniflux headers preconfigured
+    """
+    session = _requests().Session()
+    session.headers.update({
         "X-Auth-Token": api_key,
         "Content-Type": "application/json"
-    }
+    })
     
-    # Make the API request
-    response = requests.get(api_endpoint, headers=headers)
+    max_retries = 0
+    if retries > 0:
+        from urllib3.util.retry import Retry
+        
+        max_retries = Retry(
+            total=retries,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False
+        )
     
-    # Check if request was successful
-    response.raise_for_status()
+    adapter = _create_adapter(
+        pool_connections=4,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+        max_retries=max_retries
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     
-    return response.json()
+    return session
 
 
-def get_category_id_by_name(server_url: str, api_key: str, category_name: str) -> int:
+def _cache_dir() -> Optional[Path]:
     """
-    Get category ID by category name.
+    Get the cache directory under $XDG_CACHE_HOME or ~/.cache.
+    
+    Returns None if neither is set and the home directory cannot be
+    determined, in which case caching is skipped.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except (RuntimeError, KeyError):
+            return None
+    
+    return Path(base) / CACHE_DIR_NAME
+
+
+def _categories_cache_path(server_url: str, api_key: str) -> Optional[Path]:
+    """
+    Get the cache file path for a server/API key pair.
+    
+    Categories belong to a Miniflux user, so the API key is part of the
+    cache key alongside the server URL.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    
+    key = f"{server_url.rstrip('/')}\n{api_key}".encode("utf-8")
+    return cache_dir / f"categories-{hashlib.sha1(key).hexdigest()}.json"
+
+
+@dataclass
+class CachedCategories:
+    """
+    Categories loaded from the on-disk cache.
+    
+    Attributes:
+        categories: List of category dictionaries with 'id' and 'title' fields
+        etag: ETag the server returned with the categories, if any
+        mtime: When the categories were last fetched or revalidated
+    """
+    categories: list
+    etag: Optional[str] = None
+    mtime: float = 0.0
+    
+    @property
+    def fresh(self) -> bool:
+        """Whether the categories are younger than CATEGORIES_CACHE_TTL."""
+        return time.time() - self.mtime < CATEGORIES_CACHE_TTL
+
+
+def load_cached_categories(server_url: str, api_key: str) -> Optional[CachedCategories]:
+    """
+    Load categories from the on-disk cache.
+    
+    Expired entries are returned as well, so their ETag can be used to
+    revalidate them with the server.
     
     Args:
         server_url: The Miniflux server URL
         api_key: The Miniflux API key
-        category_name: The name of the category
         
     Returns:
-        int: The category ID
+        CachedCategories: The cached categories, or None if the cache is
+        missing or unreadable
+    """
+    cache_path = _categories_cache_path(server_url, api_key)
+    if cache_path is None:
+        return None
+    
+    try:
+        mtime = cache_path.stat().st_mtime
+        data = _json_loads(cache_path.read_bytes())
+        return CachedCategories(data["categories"], data.get("etag"), mtime)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_cached_categories(
+    server_url: str,
+    api_key: str,
+    categories: list,
+    etag: Optional[str] = None
+) -> None:
+    """
+    Save categories to the on-disk cache.
+    
+    The file is written to a temporary file first and then moved into
+    place, so concurrent runs never read a partially written cache.
+    Failing to write the cache is not an error; the next run simply
+    fetches the categories from the server again.
+    
+    Args:
+        server_url: The Miniflux server URL
+        api_key: The Miniflux API key
+        categories: List of category dictionaries to cache
+        etag: Optional ETag the server returned with the categories
+    """
+    cache_path = _categories_cache_path(server_url, api_key)
+    if cache_path is None:
+        return
+    
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(_json_dumps({"etag": etag, "categories": categories}))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _index_categories(categories: list) -> dict:
+    """Map lowercased category titles to category IDs."""
+    return {category['title'].lower(): category['id'] for category in categories}
+
+
+@dataclass
+class MinifluxClient:
+    """
+    Client for the Miniflux API of one server and user.
+    
+    The server URL is normalized and the authentication headers are set on
+    the session once, so every API call reuses the same setup and
+    connection pool. When no session is given, the client creates one and
+    closes it again in close() or when used as a context manager.
+    
+    Attributes:
+        base_url: The Miniflux server URL
+        api_key: The Miniflux API key
+        session: Optional session to make the requests with
+        retries: How many times to retry a failed request, used only when
+            the client creates its own session
+    """
+    base_url: str
+    api_key: str = field(repr=False)
+    session: Optional["requests.Session"] = None
+    retries: int = 0
+    _owns_session: bool = field(default=False, init=False, repr=False)
+    _categories: Optional[list] = field(default=None, init=False, repr=False)
+    _category_index: Optional[dict] = field(default=None, init=False, repr=False)
+    _categories_revalidated: bool = field(default=False, init=False, repr=False)
+    
+    def __post_init__(self):
+        validate_url(self.base_url, "server URL")
         
-    Raises:
-        ValueError: If category not found
-        requests.exceptions.RequestException: If the API request fails
+        # Ensure server URL doesn't end with a slash
+        self.base_url = self.base_url.rstrip('/')
+        
+        if self.session is None:
+            self.session = create_session(self.api_key, retries=self.retries)
+            self._owns_session = True
+    
+    def __enter__(self) -> "MinifluxClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the session if it was created by this client."""
+        if self._owns_session:
+            self.session.close()
+    
+    def categories(self, refresh: bool = False) -> list:
+        """
+        Get all categories from Miniflux server.
+        
+        Categories are served from the on-disk cache while it is fresh.
+        Otherwise they are fetched from the server, sending the cached ETag
+        so an unchanged category list costs only a 304 response.
+        
+        Args:
+            refresh: Revalidate with the server even if the cache is fresh
+            
+        Returns:
+            list: List of category dictionaries with 'id' and 'title' fields
+            
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        return self._get_categories(refresh)[0]
+    
+    def _get_categories(self, refresh: bool = False) -> Tuple[list, bool]:
+        """
+        Get all categories, reporting whether the server was contacted.
+        
+        Returns:
+            tuple: The categories, and True if they were fetched or
+            revalidated with the server rather than read from a fresh cache
+        """
+        cached = load_cached_categories(self.base_url, self.api_key)
+        if cached is not None and cached.fresh and not refresh:
+            return cached.categories, False
+        
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        
+        response = self.session.get(f"{self.base_url}/v1/categories", headers=headers)
+        
+        if response.status_code == 304 and cached is not None:
+            categories = cached.categories
+            etag = response.headers.get("ETag", cached.etag)
+        else:
+            # Check if request was successful
+            response.raise_for_status()
+            
+            categories = _json_loads(response.content)
+            etag = response.headers.get("ETag")
+        
+        save_cached_categories(self.base_url, self.api_key, categories, etag)
+        
+        return categories, True
+    
+    def _load_category_index(self, refresh: bool = False) -> None:
+        """Load the categories and build the lowercase title index."""
+        self._categories, self._categories_revalidated = self._get_categories(refresh)
+        self._category_index = _index_categories(self._categories)
+    
+    def category_id_by_name(self, category_name: str, refresh: bool = False) -> int:
+        """
+        Get category ID by category name.
+        
+        Categories are resolved from the on-disk cache when possible. A name
+        that is not in a fresh cache is looked up again after revalidating
+        the categories with the server, so newly created categories are
+        found. Categories that already came from the server are not fetched
+        a second time.
+        The lowercase title index is kept on the client, so further lookups
+        neither reload the categories nor lowercase the titles again.
+        
+        Args:
+            category_name: The name of the category
+            refresh: Revalidate the categories with the server first
+            
+        Returns:
+            int: The category ID
+            
+        Raises:
+            ValueError: If category not found
+            requests.exceptions.RequestException: If the API request fails
+        """
+        needle = category_name.lower()
+        
+        if self._category_index is None or refresh:
+            self._load_category_index(refresh)
+        
+        # The cache may predate a newly created category
+        if needle not in self._category_index and not self._categories_revalidated:
+            self._load_category_index(refresh=True)
+        
+        # Search for category by name (case-insensitive)
+        try:
+            return self._category_index[needle]
+        except KeyError:
+            # If not found, raise an error with available categories
+            available = ", ".join(f"'{cat['title']}'" for cat in self._categories)
+            raise ValueError(
+                f"Category '{category_name}' not found. Available categories: {available}"
+            ) from None
+    
+    def add_feed(self, feed_url: str, category_id: Optional[int] = None) -> dict:
+        """
+        Add a feed to Miniflux server.
+        
+        Args:
+            feed_url: The URL of the RSS/Atom feed to add
+            category_id: Optional category ID to add the feed to
+            
+        Returns:
+            dict: Response from Miniflux API containing the new 'feed_id'
+            
+        Raises:
+            ValueError: If the feed URL is malformed
+            requests.exceptions.RequestException: If the API request fails
+        """
+        validate_url(feed_url, "feed URL")
+        
+        # Prepare the payload
+        payload = {
+            "feed_url": feed_url
+        }
+        
+        if category_id:
+            payload["category_id"] = category_id
+        
+        response = self.session.post(f"{self.base_url}/v1/feeds", data=_json_dumps(payload))
+        
+        # Check if request was successful
+        response.raise_for_status()
+        
+        return _json_loads(response.content)
+    
+    def add_feeds(
+        self,
+        feed_urls: List[str],
+        category_id: Optional[int] = None
+    ) -> List[Tuple[str, Optional[dict], Optional[Exception]]]:
+        """
+        Add several feeds to Miniflux server concurrently.
+        
+        Args:
+            feed_urls: The URLs of the RSS/Atom feeds to add
+            category_id: Optional category ID to add the feeds to
+            
+        Returns:
+            list: One (feed_url, result, error) tuple per feed, in input order.
+            Exactly one of result and error is None.
+        """
+        def add(feed_url: str) -> Tuple[str, Optional[dict], Optional[Exception]]:
+            try:
+                return feed_url, self.add_feed(feed_url, category_id), None
+            except Exception as e:
+                return feed_url, None, e
+        
+        max_workers = max(1, min(MAX_CONCURRENT_REQUESTS, len(feed_urls)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(add, feed_urls))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_categories_cached(
+    server_url: str,
+    api_key: str,
+    session: Optional["requests.Session"]
+) -> tuple:
+    # Store each category as a tuple of items so cached data can't be mutated
+    with MinifluxClient(server_url, api_key, session=session) as client:
+        return tuple(tuple(category.items()) for category in client.categories())
+
+
+def get_categories(
+    server_url: str,
+    api_key: str,
+    session: Optional["requests.Session"] = None
+) -> list:
     """
-    categories = get_categories(server_url, api_key)
+    Get all categories from Miniflux server.
     
-    # Search for category by name (case-insensitive)
-    for category in categories:
-        if category['title'].lower() == category_name.lower():
-            return category['id']
+    Results are memoized in-process per server, API key and session, so
+    long-running callers fetch the categories only once. Every call returns
+    new category dictionaries, so changing them does not affect later
+    calls. Because the session is part of the key, the cache keeps up to
+    eight sessions alive, including closed ones, until
+    get_categories.cache_clear() drops them. See MinifluxClient.categories.
+    """
+    cached = _get_categories_cached(server_url.rstrip('/'), api_key, session)
+    return [dict(category) for category in cached]
+
+
+get_categories.cache_clear = _get_categories_cached.cache_clear
+
+
+def get_category_id_by_name(
+    server_url: str,
+    api_key: str,
+    category_name: str,
+    session: Optional["requests.Session"] = None
+) -> int:
+    """
+    Get category ID by category name.
     
-    # If not found, raise an error with available categories
-    available = ", ".join([f"'{cat['title']}'" for cat in categories])
-    raise ValueError(f"Category '{category_name}' not found. Available categories: {available}")
+    See MinifluxClient.category_id_by_name.
+    """
+    with MinifluxClient(server_url, api_key, session=session) as client:
+        return client.category_id_by_name(category_name)
 
 
 def add_feed_to_miniflux(
     feed_url: str,
     server_url: str,
     api_key: str,
-    category_id: Optional[int] = None
+    category_id: Optional[int] = None,
+    session: Optional["requests.Session"] = None
 ) -> dict:
     """
     Add a feed to Miniflux server.
     
-    Args:
-        feed_url: The URL of the RSS/Atom feed to add
-        server_url: The Miniflux server URL
-        api_key: The Miniflux API key
-        category_id: Optional category ID to add the feed to
-        
-    Returns:
-        dict: Response from Miniflux API containing feed details
-        
-    Raises:
-        requests.exceptions.RequestException: If the API request fails
+    See MinifluxClient.add_feed.
     """
-    # Ensure server URL doesn't end with a slash
-    server_url = server_url.rstrip('/')
+    with MinifluxClient(server_url, api_key, session=session) as client:
+        return client.add_feed(feed_url, category_id)
+
+
+def add_feeds_to_miniflux(
+    feed_urls: List[str],
+    server_url: str,
+    api_key: str,
+    category_id: Optional[int] = None,
+    session: Optional["requests.Session"] = None
+) -> List[Tuple[str, Optional[dict], Optional[Exception]]]:
+    """
+    Add several feeds to Miniflux server concurrently.
     
-    # Prepare the API endpoint
-    api_endpoint = f"{server_url}/v1/feeds"
+    See MinifluxClient.add_feeds.
+    """
+    with MinifluxClient(server_url, api_key, session=session) as client:
+        return client.add_feeds(feed_urls, category_id)
+
+
+def _error_summary(error: Exception) -> str:
+    """Get a one-line description of a failed feed addition."""
+    if isinstance(error, _requests().exceptions.HTTPError) and error.response is not None:
+        try:
+            return f"{error} ({error.response.json().get('error_message')})"
+        except Exception:
+            pass
+    return str(error)
+
+
+def _feed_result_json(
+    feed_url: str,
+    result: Optional[dict],
+    error: Optional[Exception]
+) -> str:
+    """Format the outcome of adding one feed as a JSON line."""
+    if error is not None:
+        return _json_dumps({"feed_url": feed_url, "error": _error_summary(error)}).decode("utf-8")
     
-    # Prepare headers
-    headers = {
-        "X-Auth-Token": api_key,
-        "Content-Type": "application/json"
-    }
+    return _json_dumps({"feed_url": feed_url, "feed_id": result.get("feed_id")}).decode("utf-8")
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _list_categories(client: MinifluxClient, args: argparse.Namespace) -> int:
+    """Print the categories for --list-categories and return the exit status."""
+    if not args.json:
+        print(f"Fetching categories from: {args.server}\n")
+    categories = client.categories(refresh=args.refresh_categories)
     
-    # Prepare the payload
-    payload = {
-        "feed_url": feed_url
-    }
+    if args.json:
+        _write_lines([_json_dumps(categories).decode("utf-8")])
+    elif not categories:
+        print("No categories found.")
+    else:
+        _write_lines([
+            f"Available categories ({len(categories)}):",
+            "",
+            *(f"  • {category['title']} (ID: {category['id']})" for category in categories)
+        ])
     
-    if category_id:
-        payload["category_id"] = category_id
+    return 0
+
+
+def _add_feeds(client: MinifluxClient, args: argparse.Namespace) -> int:
+    """Add the --url feeds, print the results and return the exit status."""
+    if not args.json:
+        _write_lines([
+            *(f"Adding feed: {feed_url}" for feed_url in args.url),
+            f"To server: {args.server}"
+        ])
     
-    # Make the API request
-    response = requests.post(api_endpoint, json=payload, headers=headers)
+    # Look up category ID by name if category is specified
+    category_id = None
+    if args.category:
+        if not args.json:
+            print(f"Looking up category: {args.category}")
+        category_id = client.category_id_by_name(
+            args.category,
+            refresh=args.refresh_categories
+        )
+        if not args.json:
+            print(f"Found category ID: {category_id}")
+    
+    if len(args.url) == 1 and not args.json:
+        result = client.add_feed(args.url[0], category_id)
+        
+        _write_lines([
+            "",
+            "✓ Feed added successfully!",
+            f"Feed ID: {result.get('feed_id')}"
+        ])
+        return 0
     
-    # Check if request was successful
-    response.raise_for_status()
+    results = client.add_feeds(args.url, category_id)
     
-    return response.json()
+    failed = sum(1 for _, _, error in results if error is not None)
+    if args.json:
+        _write_lines([_feed_result_json(*outcome) for outcome in results])
+    else:
+        lines = ["", f"Added {len(results) - failed} of {len(results)} feeds:", ""]
+        for feed_url, result, error in results:
+            if error is None:
+                lines.append(f"  ✓ {feed_url} (Feed ID: {result.get('feed_id')})")
+            else:
+                lines.append(f"  ✗ {feed_url}: {_error_summary(error)}")
+        _write_lines(lines)
+    
+    return 1 if failed else 0
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Add an RSS feed to a Miniflux server",
+        description="Add RSS feeds to a Miniflux server",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Environment Variables:
@@ -150,17 +690,30 @@ Examples:
   export MINIFLUX_API_KEY="YOUR_KEY"
   %(prog)s --url https://example.com/feed.xml
   
+  # Add several feeds at once
+  %(prog)s --url https://example.com/feed.xml https://example.org/rss
+  
   # Add to specific category by name
   %(prog)s --url https://example.com/feed.xml --category "Technology"
   
   # List all available categories
   %(prog)s --list-categories
+  
+  # List categories, bypassing the local cache
+  %(prog)s --list-categories --refresh-categories
+  
+  # Retry up to 3 times on connection errors
+  %(prog)s --url https://example.com/feed.xml --retry 3
+  
+  # Print one JSON line per added feed, e.g. for scripting
+  %(prog)s --url https://example.com/feed.xml --json
         """
     )
     
     parser.add_argument(
         "--url",
-        help="RSS/Atom feed URL to add"
+        nargs="+",
+        help="RSS/Atom feed URL(s) to add"
     )
     
     parser.add_argument(
@@ -187,6 +740,26 @@ Examples:
         help="List all available categories and exit"
     )
     
+    parser.add_argument(
+        "--refresh-categories",
+        action="store_true",
+        help="Revalidate the cached categories with the server"
+    )
+    
+    parser.add_argument(
+        "--retry",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Retry failed connections up to N times, and GET requests also on 502/503/504 responses"
+    )
+    
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of human-readable text"
+    )
+    
     args = parser.parse_args()
     
     # Validate required parameters
@@ -200,71 +773,30 @@ Examples:
               file=sys.stderr)
         sys.exit(1)
     
-    # Handle list-categories command
-    if args.list_categories:
-        try:
-            print(f"Fetching categories from: {args.server}\n")
-            categories = get_categories(args.server, args.api_key)
-            
-            if not categories:
-                print("No categories found.")
-            else:
-                print(f"Available categories ({len(categories)}):\n")
-                for category in categories:
-                    print(f"  • {category['title']} (ID: {category['id']})")
-            
-            sys.exit(0)
-            
-        except requests.exceptions.HTTPError as e:
-            print(f"\n✗ HTTP Error: {e}", file=sys.stderr)
-            if e.response is not None:
-                try:
-                    error_detail = e.response.json()
-                    print(f"Error details: {error_detail}", file=sys.stderr)
-                except:
-                    print(f"Response: {e.response.text}", file=sys.stderr)
-            sys.exit(1)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"\n✗ Request Error: {e}", file=sys.stderr)
-            sys.exit(1)
-            
-        except Exception as e:
-            print(f"\n✗ Unexpected Error: {e}", file=sys.stderr)
-            sys.exit(1)
+    try:
+        validate_url(args.server, "server URL")
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.retry < 0:
+        print("Error: --retry must not be negative.", file=sys.stderr)
+        sys.exit(1)
     
     # Validate URL is required when not listing categories
-    if not args.url:
+    if not args.list_categories and not args.url:
         print("Error: --url is required when adding a feed. Use --help for usage information.", 
               file=sys.stderr)
         sys.exit(1)
     
+    requests = _requests()
+    
     try:
-        print(f"Adding feed: {args.url}")
-        print(f"To server: {args.server}")
-        
-        # Look up category ID by name if category is specified
-        category_id = None
-        if args.category:
-            print(f"Looking up category: {args.category}")
-            category_id = get_category_id_by_name(
-                server_url=args.server,
-                api_key=args.api_key,
-                category_name=args.category
-            )
-            print(f"Found category ID: {category_id}")
-        
-        result = add_feed_to_miniflux(
-            feed_url=args.url,
-            server_url=args.server,
-            api_key=args.api_key,
-            category_id=category_id
-        )
-        
-        print("\n✓ Feed added successfully!")
-        print(f"Feed ID: {result.get('id')}")
-        print(f"Feed Title: {result.get('title', 'N/A')}")
-        print(f"Site URL: {result.get('site_url', 'N/A')}")
+        with MinifluxClient(args.server, args.api_key, retries=args.retry) as client:
+            if args.list_categories:
+                status = _list_categories(client, args)
+            else:
+                status = _add_feeds(client, args)
         
     except ValueError as e:
         print(f"\n✗ Error: {e}", file=sys.stderr)
@@ -287,8 +819,9 @@ Examples:
     except Exception as e:
         print(f"\n✗ Unexpected Error: {e}", file=sys.stderr)
         sys.exit(1)
+    
+    sys.exit(status)
 
 
 if __name__ == "__main__":
     main()
-